@@ -116,7 +116,7 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 # Import the pipeline components
-from slack_socket_mode import post_approval_message, app
+from slack_socket_mode import post_approval_message, app, install_shutdown_flush
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 from scheduler_config import SchedulerConfig
 
@@ -197,6 +197,10 @@ def start_socket_mode():
 
 def main(daemon_mode=False):
     """Main orchestrator function."""
+    import logging
+    # Same setup as slack_socket_mode.main(): the Socket Mode handlers log through logging, to stdout
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [Socket Mode] %(levelname)s: %(message)s',
+                        stream=sys.stdout)
 
     print("""
 ╔══════════════════════════════════════════════════════════════╗
@@ -223,6 +227,9 @@ def main(daemon_mode=False):
         print("Please add them to your .env file")
         return
 
+    # Flush the Socket Mode handlers' queued state saves if the process is killed
+    install_shutdown_flush()
+
     # Start Socket Mode in a background thread
     socket_thread = threading.Thread(target=start_socket_mode, daemon=True)
     socket_thread.start()
@@ -1211,7 +1211,7 @@ def refresh_release_versions(message_ts: str = None) -> Dict:
             try:
                 from slack_socket_mode import load_approval_states
                 approval_states = load_approval_states()
-                for pl, state in approval_states.get(message_ts, {}).items():
+                for pl, state in list(approval_states.get(message_ts, {}).items()):
                     if state.get('status') == 'tomorrow':
                         excluded_pls_clean.add(clean_pl_name(pl).lower())
             except Exception:
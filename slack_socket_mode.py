@@ -9,10 +9,18 @@ Features:
 """
 
 import os
+import sys
+import atexit
 import json
+import logging
 import re
+import signal
+import ssl
+import functools
 import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from slack_bolt import App
@@ -20,8 +28,16 @@ from slack_bolt.adapter.socket_mode import SocketModeHandler
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Product Line order - grouped by category for consistent display
 PRODUCT_LINE_ORDER = [
     "Media PL1", "Media PL2", "Media",
@@ -33,14 +49,56 @@ PRODUCT_LINE_ORDER = [
     "Helix PL3", "Helix",
     "Data Governance", "Other",
 ]
+_PL_ORDER_INDEX = {pl: i for i, pl in enumerate(PRODUCT_LINE_ORDER)}
 
 APPROVAL_STATES_FILE = 'approval_states.json'
 MESSAGE_METADATA_FILE = 'message_metadata.json'
 DEFERRED_PLS_FILE = 'deferred_pls.json'
 LAST_ANNOUNCEMENT_FILE = 'last_announcement.json'
+SLACK_TEXT_LIMIT = 40000
+
+_PL_YEAR_RE = re.compile(r'\s+20\d{2}$')
+_ACTION_ID_UNSAFE_RE = re.compile(r'[^a-zA-Z0-9]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_COLON_SPACING_RE = re.compile(r'\s*:\s*')
+
+# Line patterns used by auto_format_text
+_RULE_RE = re.compile(r'[-–—]{3,}')
+_MD_BOLD_RELEASE_RE = re.compile(r'^\*{2}([^*]+)\*{2}:\s*(Release\s+\d+\.\d+)$')
+_MD_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_VALUE_ADD_LABEL_RE = re.compile(r'^\*\s*Value Add\s*\*:\s*', re.IGNORECASE)
+_BUG_FIXES_LABEL_RE = re.compile(r'^\*\s*Bug Fixes\s*\*:\s*', re.IGNORECASE)
+_STAR_BULLET_RE = re.compile(r'^\*\s+')
+_DASH_BULLET_RE = re.compile(r'^[\-]\s+')
+_BULLET_CHARS = frozenset('●•*-')
+_SLACK_LINK_RE = re.compile(r'<([^|>]+)\|(.+)>')
+# "PL: <url|Release X>" or "*PL*: Release X" in a single match; branch on which groups are set
+_LINE_DISPATCH_RE = re.compile(
+    r'(?P<link_pl>[^:]+):\s*<(?P<link_url>[^|>]+)\|(?P<link_ver>Release\s+\d+\.\d+)>'
+    r'|\*?(?P<pl>[^*:]+)\*?:\s*(?P<ver>Release\s+\d+\.\d+)'
+)
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_MULTI_STAR_RE = re.compile(r'\*{3,}')
+# Google Doc section markers used when restoring a PL
+_DOC_SEPARATOR_RE = re.compile(r'\n═{20,}\n')
+_DOC_TLDR_HEADER_RE = re.compile(r'-{10,}\s*TL;DR:?\s*-{10,}', re.IGNORECASE)
+_DOC_SECTION_HEADER_RE = re.compile(r'\n-{10,}[^-]+-{10,}')
+_DOC_PL_HEADER_RE = re.compile(r'(^[^\n]+:\s*Release\s+\d+(?:\.\d+)?)', re.MULTILINE)
+# Literal line keys checked per line
+_VALUE_ADD_KEYS = frozenset({'value add', 'value add:'})
+_BUG_FIX_KEYS = frozenset({'bug fixes', 'bug fixes:'})
+_STATUS_LITERALS = frozenset({'General Availability', 'Feature Flag', 'Beta'})
+_STATUS_KEYS = frozenset({'general availability', 'feature flag', 'beta'})
+_IGNORED_SECTION_KEYS = frozenset({'uncategorized', 'other'})
+_NON_HEADER_KEYS = _VALUE_ADD_KEYS | _BUG_FIX_KEYS | {'key deployments', 'tl;dr', 'daily deployment summary'}
+# Section label lines: normalized text -> (rendered label, bullet section it opens)
+_SECTION_LABELS = {key: ('*Value Add:*', 'value_add') for key in _VALUE_ADD_KEYS}
+_SECTION_LABELS.update({key: ('*Bug Fixes:*', 'bug_fixes') for key in _BUG_FIX_KEYS})
+_LINE_MARKER_PREFIXES = ('●', '•', '-', '*', '`')
 
 app = App(token=os.getenv("SLACK_BOT_TOKEN"))
-client = WebClient(token=os.getenv("SLACK_BOT_TOKEN"))
+# Reuse one TLS context for every Web API call; otherwise each request builds a new one and reloads the CA bundle
+client = WebClient(token=os.getenv("SLACK_BOT_TOKEN"), ssl=ssl.create_default_context())
 
 
 @app.error
@@ -55,29 +113,158 @@ def handle_broken_pipe(error, body, logger):
 
 
 def get_ordered_pls(pl_list: list) -> list:
-    ordered = []
-    for pl in PRODUCT_LINE_ORDER:
-        if pl in pl_list:
-            ordered.append(pl)
-    for pl in pl_list:
-        if pl not in ordered:
-            ordered.append(pl)
-    return ordered
+    # Known PLs in display order, then any others in their original order (sort is stable)
+    unknown = len(PRODUCT_LINE_ORDER)
+    return sorted(dict.fromkeys(pl_list), key=lambda pl: _PL_ORDER_INDEX.get(pl, unknown))
+
+
+# Parsed JSON state keyed by path -> ((mtime_ns, size), data); a file is only
+# re-read when another process (or a manual edit) changes it on disk.
+_json_cache = {}
+
+
+def _file_signature(path: str):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _parse_json_bytes(raw: bytes):
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals, which the stdlib parser still accepts
+    return json.loads(raw)
+
+
+def _dump_json_bytes(data) -> bytes:
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            pass  # e.g. non-str dict keys, which the stdlib encoder coerces
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
 
 
 def load_json(path: str, default):
+    pending = _pending_writes.get(path)
+    if pending is not None:
+        return pending
+    try:
+        signature = _file_signature(path)
+    except OSError:
+        return default
+    cached = _json_cache.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
     try:
-        with open(path, 'r') as f:
-            return json.load(f)
+        with open(path, 'rb') as f:
+            data = _parse_json_bytes(f.read())
     except FileNotFoundError:
         return default
     except Exception:
         return default
+    _json_cache[path] = (signature, data)
+    return data
+
+
+_save_lock = threading.Lock()
 
 
 def save_json(path: str, data):
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Serialize compactly up front so the file is written with a single call
+    payload = _dump_json_bytes(data)
+    with _save_lock:
+        # Write a sibling temp file and swap it in, so readers never see a truncated file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        _json_cache[path] = (_file_signature(path), data)
+
+
+# Write-behind for state that changes on every click: saves within the debounce
+# window are coalesced into one disk write per file. Pending data stays visible
+# to load_json until it has been written.
+WRITE_DEBOUNCE_SECONDS = 0.5
+_pending_writes = {}
+_pending_versions = {}
+_pending_lock = threading.Lock()
+_pending_event = threading.Event()
+_writer_thread = None
+_shutdown_flush_installed = False
+
+
+def flush_pending_writes():
+    # Snapshot under the lock but write outside it, so handlers queueing new saves
+    # never wait on disk; an entry is only dropped if no save was queued meanwhile.
+    with _pending_lock:
+        pending = [(path, data, _pending_versions[path]) for path, data in _pending_writes.items()]
+    for path, data, version in pending:
+        try:
+            save_json(path, data)
+        except Exception as e:
+            logger.error("Error writing %s: %s", path, e)
+            continue
+        with _pending_lock:
+            if _pending_versions.get(path) == version:
+                del _pending_writes[path]
+
+
+def _write_behind_loop():
+    while True:
+        _pending_event.wait()
+        time.sleep(WRITE_DEBOUNCE_SECONDS)
+        _pending_event.clear()
+        flush_pending_writes()
+
+
+def _schedule_write(path: str, data):
+    global _writer_thread
+    if not _shutdown_flush_installed:
+        # Without the SIGTERM hook a kill would skip atexit and drop queued saves
+        save_json(path, data)
+        return
+    with _pending_lock:
+        _pending_writes[path] = data
+        _pending_versions[path] = _pending_versions.get(path, 0) + 1
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_write_behind_loop, daemon=True)
+            _writer_thread.start()
+    _pending_event.set()
+
+
+atexit.register(flush_pending_writes)
+
+
+def _exit_on_signal(signum, frame):
+    # SIGTERM's default action skips atexit; exit through SystemExit so queued saves are flushed
+    raise SystemExit(128 + signum)
+
+
+def install_shutdown_flush():
+    """Flush queued state saves on SIGTERM and enable write-behind.
+
+    Must be called from the main thread of any process hosting `app`; until then
+    approval and deferred saves are written synchronously.
+    """
+    global _shutdown_flush_installed
+    signal.signal(signal.SIGTERM, _exit_on_signal)
+    _shutdown_flush_installed = True
+
+
+# load_json hands every caller the same cached dict, so handlers hold this lock across
+# load -> mutate -> save, and readers on other threads iterate snapshots of it.
+_state_lock = threading.RLock()
 
 
 def load_approval_states():
@@ -85,7 +272,7 @@ def load_approval_states():
 
 
 def save_approval_states(states: dict):
-    save_json(APPROVAL_STATES_FILE, states)
+    _schedule_write(APPROVAL_STATES_FILE, states)
 
 
 def load_message_metadata():
@@ -101,11 +288,12 @@ def load_deferred_pls():
 
 
 def save_deferred_pls(deferred: dict):
-    save_json(DEFERRED_PLS_FILE, deferred)
+    _schedule_write(DEFERRED_PLS_FILE, deferred)
 
 
+@functools.lru_cache(maxsize=1024)
 def clean_pl_name_for_action(pl_name: str) -> str:
-    return re.sub(r'[^a-zA-Z0-9]', '_', pl_name)
+    return _ACTION_ID_UNSAFE_RE.sub('_', pl_name)
 
 
 def get_pl_name_from_action(action_id: str) -> str:
@@ -115,8 +303,33 @@ def get_pl_name_from_action(action_id: str) -> str:
     return action_id
 
 
+def _build_action_map(pls: list) -> dict:
+    """Map action id suffixes back to the exact PL names they were built from."""
+    action_map = {}
+    for pl in pls:
+        action_map.setdefault(clean_pl_name_for_action(pl), pl)
+    return action_map
+
+
+def _pl_name_for_action(action_id: str, message_ts: str, message_metadata: dict = None) -> str:
+    # Messages posted before action maps were stored fall back to the lossy decode
+    if message_metadata is None:
+        message_metadata = load_message_metadata()
+    suffix = action_id.split('_', 1)[-1]
+    action_map = message_metadata.get(message_ts, {}).get('action_map') or {}
+    return action_map.get(suffix) or get_pl_name_from_action(action_id)
+
+
+@functools.lru_cache(maxsize=512)
+def _strip_year(pl_name: str) -> str:
+    # Most names carry no " 20XX" suffix; skip the regex unless the tail could match
+    if not (pl_name[-4:-2] == '20' and pl_name[-2:].isdigit() and pl_name[-5:-4].isspace()):
+        return pl_name
+    return _PL_YEAR_RE.sub('', pl_name)
+
+
 def _clean_pl_name_for_doc(pl_name: str) -> str:
-    return re.sub(r'\s+20\d{2}$', '', pl_name).strip()
+    return _strip_year(pl_name).strip()
 
 
 def build_refresh_blocks() -> list:
@@ -129,36 +342,100 @@ def build_refresh_blocks() -> list:
     ]
 
 
+# Static review-message blocks are shared between renders; Slack only serializes them
+_REVIEW_HEADER_BLOCK = {"type": "header", "text": {"type": "plain_text", "text": "Release Notes Review", "emoji": True}}
+_DIVIDER_BLOCK = {"type": "divider"}
+
+
+def _review_header_blocks(release_date: str, doc_url: str) -> list:
+    blocks = [
+        _REVIEW_HEADER_BLOCK,
+        {"type": "section", "text": {"type": "mrkdwn", "text": f"Daily Consolidated Deployment Summary" + (f" - {release_date}" if release_date else "")}}
+    ]
+    if doc_url:
+        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": f"<{doc_url}|📄 View Release Notes>"}})
+    blocks.extend(build_refresh_blocks())
+    blocks.append(_DIVIDER_BLOCK)
+    return blocks
+
+
 def _resolve_pl_key(pl_name: str, notes_by_pl: dict) -> str:
     if pl_name in notes_by_pl:
         return pl_name
     pl_clean = _clean_pl_name_for_doc(pl_name)
-    for key in notes_by_pl.keys():
+    for key in list(notes_by_pl):
         if _clean_pl_name_for_doc(key) == pl_clean:
             return key
     return pl_name
 
 
-def _resolve_pl_key_from_processed(pl_name: str, processed_data: dict) -> str:
-    pl_clean = _clean_pl_name_for_doc(pl_name)
+# (processed_data, key index) for the last payload indexed; rebuilt when load_json
+# hands back a new processed_notes.json dict.
+_processed_key_index_cache = (None, {})
+
+
+def _build_processed_key_index(processed_data: dict) -> dict:
+    """Map year-stripped PL names to the first matching key in processed_notes.json."""
+    global _processed_key_index_cache
+    cached_data, cached_index = _processed_key_index_cache
+    if cached_data is processed_data:
+        return cached_index
     candidates = []
     candidates.extend(processed_data.get("product_lines", []) or [])
     candidates.extend(list((processed_data.get("tldr_by_pl", {}) or {}).keys()))
     candidates.extend(list((processed_data.get("body_by_pl", {}) or {}).keys()))
     candidates.extend(list((processed_data.get("release_versions", {}) or {}).keys()))
+    index = {}
     for key in candidates:
-        if _clean_pl_name_for_doc(key) == pl_clean:
-            return key
-    return pl_name
+        index.setdefault(_clean_pl_name_for_doc(key), key)
+    _processed_key_index_cache = (processed_data, index)
+    return index
+
+
+# (processed_data, name map) for the last processed_notes.json payload seen by
+# handle_tomorrow; load_json hands back the same dict until the file changes.
+_product_line_map_cache = (None, {})
+
+
+def _product_line_name_map(processed_data: dict) -> dict:
+    """Map exact and year-stripped product line names to the first matching product line."""
+    global _product_line_map_cache
+    cached_data, name_map = _product_line_map_cache
+    if cached_data is processed_data:
+        return name_map
+    name_map = {}
+    for pl in processed_data.get('product_lines', []):
+        name_map.setdefault(pl, pl)
+        name_map.setdefault(_strip_year(pl), pl)
+    _product_line_map_cache = (processed_data, name_map)
+    return name_map
+
+
+def _resolve_pl_key_from_processed(pl_name: str, processed_data: dict, key_index: dict = None) -> str:
+    if key_index is None:
+        key_index = _build_processed_key_index(processed_data)
+    return key_index.get(_clean_pl_name_for_doc(pl_name), pl_name)
+
+
+def _resolve_announce_body(pl: str, processed_data: dict, key_index: dict, notes_by_pl: dict, deferred_epics: list = None):
+    """Return (resolved_key, body) for an approved PL, minus any deferred epics."""
+    body_by_pl = processed_data.get('body_by_pl', {})
+    resolved_key = _resolve_pl_key_from_processed(pl, processed_data, key_index)
+    body = body_by_pl.get(resolved_key, "") or body_by_pl.get(pl, "") or body_by_pl.get(_strip_year(pl), "")
+    if not body and notes_by_pl:
+        notes_key = _resolve_pl_key(pl, notes_by_pl)
+        body = notes_by_pl.get(notes_key, "")
+    if deferred_epics and body:
+        body = _filter_body_by_deferred_epics(body, deferred_epics)
+    return resolved_key, body
 
 
 def _build_text_blocks(text: str, chunk_size: int = 3000):
-    chunks = []
-    remaining = text or ""
-    while remaining:
-        chunks.append(remaining[:chunk_size])
-        remaining = remaining[chunk_size:]
-    return [{"type": "section", "text": {"type": "mrkdwn", "text": chunk}} for chunk in chunks] or [
+    text = text or ""
+    return [
+        {"type": "section", "text": {"type": "mrkdwn", "text": text[i:i + chunk_size]}}
+        for i in range(0, len(text), chunk_size)
+    ] or [
         {"type": "section", "text": {"type": "mrkdwn", "text": ""}}
     ]
 
@@ -172,7 +449,7 @@ def _extract_epics_from_body(body_text: str) -> list:
         if cleaned.startswith("#### "):
             cleaned = cleaned[5:].strip()
         cleaned = cleaned.replace("**", "").strip()
-        link_match = re.match(r'^\[([^\]]+)\]\([^)]+\)$', cleaned)
+        link_match = _MD_LINK_RE.fullmatch(cleaned)
         if link_match:
             cleaned = link_match.group(1).strip()
         return cleaned
@@ -186,9 +463,9 @@ def _extract_epics_from_body(body_text: str) -> list:
         lowered = stripped.lower()
         if lowered.startswith("value add") or lowered.startswith("bug fix"):
             return False
-        if lowered in ("general availability", "feature flag", "beta"):
+        if lowered in _STATUS_KEYS:
             return False
-        if lowered in ("uncategorized", "other"):
+        if lowered in _IGNORED_SECTION_KEYS:
             return False
         if "bug fix" in lowered:
             return False
@@ -212,7 +489,7 @@ def _split_body_by_epic(body_text: str) -> list:
         if cleaned.startswith("#### "):
             cleaned = cleaned[5:].strip()
         cleaned = cleaned.replace("**", "").strip()
-        link_match = re.match(r'^\[([^\]]+)\]\([^)]+\)$', cleaned)
+        link_match = _MD_LINK_RE.fullmatch(cleaned)
         if link_match:
             cleaned = link_match.group(1).strip()
         return cleaned
@@ -223,14 +500,14 @@ def _split_body_by_epic(body_text: str) -> list:
             return False
         if stripped.startswith(("●", "•", "-", "*")):
             return False
-        if re.fullmatch(r'[-–—]{3,}', stripped):
+        if _RULE_RE.fullmatch(stripped):
             return False
         lowered = stripped.lower()
         if lowered.startswith("value add") or lowered.startswith("bug fix"):
             return False
-        if lowered in ("general availability", "feature flag", "beta"):
+        if lowered in _STATUS_KEYS:
             return False
-        if lowered in ("uncategorized", "other"):
+        if lowered in _IGNORED_SECTION_KEYS:
             return False
         if "bug fix" in lowered:
             return False
@@ -244,7 +521,7 @@ def _split_body_by_epic(body_text: str) -> list:
             current_lines = [line]
         else:
             if current_epic:
-                if not re.fullmatch(r'\s*[-–—]{3,}\s*', line.strip()):
+                if not _RULE_RE.fullmatch(line.strip()):
                     current_lines.append(line)
             else:
                 current_epic = "Other"
@@ -263,7 +540,7 @@ def _filter_body_by_deferred_epics(body_text: str, deferred_epics: list) -> str:
         if cleaned.startswith("#### "):
             cleaned = cleaned[5:].strip()
         cleaned = cleaned.replace("**", "").strip()
-        link_match = re.match(r'^\[([^\]]+)\]\([^)]+\)$', cleaned)
+        link_match = _MD_LINK_RE.fullmatch(cleaned)
         if link_match:
             cleaned = link_match.group(1).strip()
         return cleaned.lower().strip()
@@ -279,22 +556,59 @@ def _filter_body_by_deferred_epics(body_text: str, deferred_epics: list) -> str:
     return "\n".join(kept).strip() + ("\n" if kept else "")
 
 
-def auto_format_text(text: str, processed_data: dict = None) -> str:
-    if processed_data is None:
-        try:
-            with open('processed_notes.json', 'r') as f:
-                processed_data = json.load(f)
-        except Exception:
-            processed_data = {}
+@functools.lru_cache(maxsize=4096)
+def _normalize_epic_key(text: str) -> str:
+    text = _WHITESPACE_RE.sub(' ', text.strip().lower())
+    text = _COLON_SPACING_RE.sub(':', text)
+    return text
+
+
+def _strip_header_prefix(s: str) -> str:
+    """Drop a leading markdown heading marker (two or more '#')."""
+    t = s.lstrip()
+    if t.startswith('##'):
+        return t.lstrip('#').lstrip()
+    return s
+
+
+def _strip_formatting(s: str) -> str:
+    s = _strip_header_prefix(s.strip('*'))
+    # Unwrap "<url|text>"; the url part runs up to the first '|'
+    if s.startswith('<') and s.endswith('>'):
+        pipe = s.find('|')
+        if 1 < pipe < len(s) - 2:
+            s = s[pipe + 1:-1].strip('*')
+    return s.strip()
 
-    fix_version_urls = processed_data.get('fix_version_urls', {})
-    epic_urls_by_pl = processed_data.get('epic_urls_by_pl', {})
-    epic_urls_flat = processed_data.get('epic_urls', {})
 
-    def _normalize_epic_key(text: str) -> str:
-        text = re.sub(r'\s+', ' ', text.strip().lower())
-        text = re.sub(r'\s*:\s*', ':', text)
-        return text
+def _parse_slack_link(s: str):
+    if not (s.startswith('<') and s.endswith('>') and '|' in s):
+        return None
+    match = _SLACK_LINK_RE.fullmatch(s)
+    if not match:
+        return None
+    return match.group(1), match.group(2)
+
+
+# (source dicts, indexes) for the last payload formatted. Keyed on the three source
+# dicts rather than the payload: the last-announcement snapshot is rebuilt on every
+# save but shares these dicts with load_json's cached processed_notes.json.
+_format_index_cache = (None, None)
+
+
+def _build_format_indexes(processed_data: dict):
+    """Fix version and epic lookup structures used by auto_format_text."""
+    global _format_index_cache
+    sources = (processed_data.get('fix_version_urls'),
+               processed_data.get('epic_urls_by_pl'),
+               processed_data.get('epic_urls'))
+    cached_sources, indexes = _format_index_cache
+    if cached_sources is not None and all(a is b for a, b in zip(cached_sources, sources)):
+        return indexes
+
+    fix_version_urls = sources[0] or {}
+    epic_urls_by_pl = sources[1] or {}
+    epic_urls_flat = sources[2] or {}
 
     # Flatten epic URLs for easier lookup
     all_epic_urls = {}
@@ -305,241 +619,281 @@ def auto_format_text(text: str, processed_data: dict = None) -> str:
     if epic_urls_flat:
         for epic_name, epic_url in epic_urls_flat.items():
             all_epic_urls[_normalize_epic_key(epic_name)] = (epic_name, epic_url)
+    # Case-folded and year-stripped fix version lookups; the first stored PL wins
+    fv_lower = {}
+    fv_clean = {}
+    for stored_pl, stored_url in fix_version_urls.items():
+        stored_pl_lower = stored_pl.lower()
+        fv_lower.setdefault(stored_pl_lower, stored_url)
+        fv_clean.setdefault(_strip_year(stored_pl_lower), stored_url)
+    # Substring fallback keeps the stored order, as the original scan did
+    fv_items = list(fv_lower.items())
+
+    # Token sets are computed once here rather than per (line, epic) pair
+    epic_index = []
+    for epic_key, (epic_name, epic_url) in all_epic_urls.items():
+        epic_words = frozenset(epic_key.split())
+        epic_index.append((epic_name, epic_url, epic_words, len(epic_words)))
+    # Word -> positions in epic_index; an overlap match needs at least one shared word
+    epics_by_word = {}
+    for position, (_, _, epic_words, _) in enumerate(epic_index):
+        for word in epic_words:
+            epics_by_word.setdefault(word, []).append(position)
+
+    indexes = (fv_lower, fv_clean, fv_items, all_epic_urls, epic_index, epics_by_word)
+    _format_index_cache = (sources, indexes)
+    return indexes
 
-    lines = (text or "").split('\n')
-    formatted_lines = []
 
-    def strip_formatting(s: str) -> str:
-        s = s.strip('*')
-        s = re.sub(r'^\s*#{2,}\s*', '', s)
-        link_match = re.match(r'^<[^|]+\|(.+)>$', s)
-        if link_match:
-            s = link_match.group(1).strip('*')
-        return s.strip()
+def auto_format_text(text: str, processed_data: dict = None) -> str:
+    if processed_data is None:
+        processed_data = load_json('processed_notes.json', {})
+    fv_lower, fv_clean, fv_items, all_epic_urls, epic_index, epics_by_word = _build_format_indexes(processed_data)
 
-    def _parse_slack_link(s: str):
-        match = re.match(r'^<([^|>]+)\|(.+)>$', s)
-        if not match:
-            return None
-        return match.group(1), match.group(2)
+    lines = (text or "").split('\n')
+    formatted_lines = []
+    append = formatted_lines.append
 
-    in_value_add = False
-    in_bug_fixes = False
+    # Bullet section the current line belongs to: None, 'value_add' or 'bug_fixes'
+    section = None
     for line in lines:
         stripped = line.strip()
         if not stripped:
-            formatted_lines.append('')
-            in_value_add = False
-            in_bug_fixes = False
+            append('')
+            section = None
             continue
-        if re.fullmatch(r'[-–—]{3,}', stripped):
+        if _RULE_RE.fullmatch(stripped):
             continue
 
         # Normalize markdown bold (**text**) to Slack bold (*text*)
-        stripped = re.sub(r'^\*{2}([^*]+)\*{2}:\s*(Release\s+\d+\.\d+)$', r'*\1*: \2', stripped)
-        stripped = re.sub(r'\*\*([^*]+)\*\*', r'*\1*', stripped)
-        stripped = stripped.replace("**", "")
+        if '**' in stripped:
+            stripped = _MD_BOLD_RELEASE_RE.sub(r'*\1*: \2', stripped)
+            stripped = _MD_BOLD_RE.sub(r'*\1*', stripped)
+            stripped = stripped.replace("**", "")
 
         parsed_link = _parse_slack_link(stripped)
         if parsed_link:
             url, link_text = parsed_link
-            link_clean = strip_formatting(link_text)
+            link_clean = _strip_formatting(link_text)
             if link_clean.startswith("Release "):
-                formatted_lines.append(stripped)
+                append(stripped)
             else:
-                formatted_lines.append(f"<{url}|*{link_clean}*>")
-            in_value_add = False
-            in_bug_fixes = False
+                append(f"<{url}|*{link_clean}*>")
+            section = None
             continue
 
         # Strip markdown heading prefixes
-        stripped = re.sub(r'^\s*#{2,}\s*', '', stripped)
-        stripped = re.sub(r'^\*\s*Value Add\s*\*:\s*', 'Value Add: ', stripped, flags=re.IGNORECASE)
-        stripped = re.sub(r'^\*\s*Bug Fixes\s*\*:\s*', 'Bug Fixes: ', stripped, flags=re.IGNORECASE)
-        stripped = re.sub(r'^\*\s+', '• ', stripped)
-        stripped = re.sub(r'^[\-]\s+', '• ', stripped)
-        bullet_stripped = re.sub(r'^[●•\*\-]\s*', '', stripped)
-        clean_text = strip_formatting(bullet_stripped)
+        stripped = _strip_header_prefix(stripped)
+        # Label and bullet rewrites are mutually exclusive and keyed on the first char,
+        # so stop at the first pattern that substitutes
+        first_char = stripped[:1]
+        if first_char == '*':
+            for pattern, repl in ((_VALUE_ADD_LABEL_RE, 'Value Add: '),
+                                  (_BUG_FIXES_LABEL_RE, 'Bug Fixes: '),
+                                  (_STAR_BULLET_RE, '• ')):
+                new_stripped, count = pattern.subn(repl, stripped)
+                if count:
+                    stripped = new_stripped
+                    break
+        elif first_char == '-':
+            new_stripped, count = _DASH_BULLET_RE.subn('• ', stripped)
+            if count:
+                stripped = new_stripped
+        bullet_stripped = stripped[1:].lstrip() if stripped[:1] in _BULLET_CHARS else stripped
+        clean_text = _strip_formatting(bullet_stripped)
         clean_lower = _normalize_epic_key(clean_text)
-        if clean_lower in ("uncategorized", "other"):
+        if clean_lower in _IGNORED_SECTION_KEYS:
             continue
-        if "bug fix" in clean_lower and clean_lower not in ("bug fixes", "bug fixes:"):
+        if "bug fix" in clean_lower and clean_lower not in _BUG_FIX_KEYS:
             continue
 
+        line_match = _LINE_DISPATCH_RE.fullmatch(stripped)
+
         # Normalize "PL: <url|Release X>" to bold PL name
-        release_link_match = re.match(r'^([^:]+):\s*<([^|>]+)\|(Release\s+\d+\.\d+)>$', stripped)
-        if release_link_match:
-            pl_name = release_link_match.group(1).strip()
-            url = release_link_match.group(2).strip()
-            release_ver = release_link_match.group(3).strip()
-            formatted_lines.append(f"*{pl_name}*: <{url}|{release_ver}>")
-            in_value_add = False
-            in_bug_fixes = False
+        if line_match and line_match.group('link_url') is not None:
+            pl_name = line_match.group('link_pl').strip()
+            url = line_match.group('link_url').strip()
+            release_ver = line_match.group('link_ver').strip()
+            append(f"*{pl_name}*: <{url}|{release_ver}>")
+            section = None
             continue
 
-        if clean_lower in ('value add:', 'value add'):
-            formatted_lines.append('*Value Add:*')
-            in_value_add = True
-            in_bug_fixes = False
-            continue
-        if clean_lower in ('bug fixes:', 'bug fixes'):
-            formatted_lines.append('*Bug Fixes:*')
-            in_bug_fixes = True
-            in_value_add = False
+        section_label = _SECTION_LABELS.get(clean_lower)
+        if section_label:
+            append(section_label[0])
+            section = section_label[1]
             continue
 
-        if clean_text in ('General Availability', 'Feature Flag', 'Beta'):
-            formatted_lines.append(f'`{clean_text}`')
-            in_value_add = False
-            in_bug_fixes = False
+        if clean_text in _STATUS_LITERALS:
+            append(f'`{clean_text}`')
+            section = None
             continue
 
-        release_match = re.match(r'^\*?([^*:]+)\*?:\s*(Release\s+\d+\.\d+)$', stripped)
-        if release_match and '<' not in stripped:
-            pl_name = release_match.group(1).strip()
-            release_ver = release_match.group(2)
-            url = None
+        if line_match and line_match.group('ver') is not None and '<' not in stripped:
+            pl_name = line_match.group('pl').strip()
+            release_ver = line_match.group('ver')
             pl_name_lower = pl_name.lower()
-            for stored_pl, stored_url in fix_version_urls.items():
-                stored_pl_lower = stored_pl.lower()
-                stored_pl_clean = re.sub(r'\s+20\d{2}$', '', stored_pl_lower)
-                pl_name_clean = re.sub(r'\s+20\d{2}$', '', pl_name_lower)
-                if (pl_name_lower == stored_pl_lower or
-                    pl_name_clean == stored_pl_clean or
-                    pl_name_lower in stored_pl_lower or
-                    stored_pl_lower in pl_name_lower):
-                    url = stored_url
-                    break
+            url = fv_lower.get(pl_name_lower)
+            if url is None:
+                url = fv_clean.get(_strip_year(pl_name_lower))
+            if url is None:
+                for stored_pl_lower, stored_url in fv_items:
+                    if pl_name_lower in stored_pl_lower or stored_pl_lower in pl_name_lower:
+                        url = stored_url
+                        break
             if url:
-                formatted_lines.append(f"*{pl_name}*: <{url}|{release_ver}>")
-                in_value_add = False
-                in_bug_fixes = False
+                append(f"*{pl_name}*: <{url}|{release_ver}>")
+                section = None
                 continue
             # No URL available, still keep bold PL name
-            formatted_lines.append(f"*{pl_name}*: {release_ver}")
-            in_value_add = False
-            in_bug_fixes = False
+            append(f"*{pl_name}*: {release_ver}")
+            section = None
             continue
 
-        md_link = re.match(r'^\[([^\]]+)\]\(([^)]+)\)$', clean_text)
+        md_link = _MD_LINK_RE.fullmatch(clean_text)
         if md_link:
             md_text = md_link.group(1).strip()
             md_url = md_link.group(2).strip()
-            formatted_lines.append(f"<{md_url}|*{md_text}*>")
+            append(f"<{md_url}|*{md_text}*>")
             continue
 
         clean_words = set(clean_lower.split())
-        found_epic = False
-        for epic_key, (epic_name, epic_url) in all_epic_urls.items():
-            epic_words = set(epic_key.split())
-            if not epic_words or not clean_words:
-                continue
-            common = clean_words & epic_words
-            forward_ratio = len(common) / len(epic_words)
-            reverse_ratio = len(common) / len(clean_words)
-            if forward_ratio >= 0.7 or reverse_ratio >= 0.7:
-                formatted_lines.append(f"<{epic_url}|*{clean_text}*>")
-                found_epic = True
-                break
-
-        if found_epic:
-            in_value_add = False
-            in_bug_fixes = False
+        epic_match = all_epic_urls.get(clean_lower) if clean_words else None
+        if epic_match is None and clean_words:
+            clean_count = len(clean_words)
+            # Shared-word counts per candidate epic, tallied from the index instead of set intersections
+            overlap = {}
+            for word in clean_words:
+                for position in epics_by_word.get(word, ()):
+                    overlap[position] = overlap.get(position, 0) + 1
+            for position in sorted(overlap):
+                epic_name, epic_url, _, epic_count = epic_index[position]
+                common_count = overlap[position]
+                forward_ratio = common_count / epic_count
+                reverse_ratio = common_count / clean_count
+                if forward_ratio >= 0.7 or reverse_ratio >= 0.7:
+                    epic_match = (epic_name, epic_url)
+                    break
+
+        if epic_match:
+            append(f"<{epic_match[1]}|*{clean_text}*>")
+            section = None
             continue
 
         # If this looks like an epic line and we couldn't link it, bold it
+        is_marked = stripped.startswith(_LINE_MARKER_PREFIXES)
         looks_like_header = (
-            not in_value_add and
-            not in_bug_fixes and
-            not stripped.startswith(('●', '•', '-', '*', '`')) and
-            clean_lower not in ('value add', 'value add:', 'bug fixes', 'bug fixes:',
-                                'key deployments', 'tl;dr', 'daily deployment summary')
+            section is None and
+            not is_marked and
+            clean_lower not in _NON_HEADER_KEYS
         )
         if looks_like_header and clean_text:
-            formatted_lines.append(f"*{clean_text}*")
+            append(f"*{clean_text}*")
             continue
 
         # Skip bullets/prose from epic matching
-        if '<' in stripped or stripped.startswith(('●', '•', '-', '*', '`')):
-            formatted_lines.append(stripped)
+        if '<' in stripped or is_marked:
+            append(stripped)
             continue
-        if in_value_add or in_bug_fixes:
-            formatted_lines.append(f"• {stripped}")
+        if section is not None:
+            append(f"• {stripped}")
         else:
-            formatted_lines.append(stripped)
+            append(stripped)
 
     formatted_text = '\n'.join(formatted_lines)
     formatted_text = formatted_text.replace("**", "*")
-    formatted_text = re.sub(r'\*{3,}', '*', formatted_text)
+    formatted_text = _MULTI_STAR_RE.sub('*', formatted_text)
     return formatted_text
 
 
+# Post-ack work runs on a shared pool instead of a fresh thread per event
+_handler_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="handler")
+
+
+def _log_task_error(future):
+    error = future.exception()
+    if error:
+        logger.error("Background task failed: %s", error)
+
+
 def run_async(target, *args, **kwargs):
-    threading.Thread(target=target, args=args, kwargs=kwargs, daemon=True).start()
+    _handler_executor.submit(target, *args, **kwargs).add_done_callback(_log_task_error)
+
+
+_STATUS_TEXT = {
+    'approved': '✅ Approved',
+    'rejected': '⏸️ Deferred (Full)',
+    'deferred_full': '⏸️ Deferred (Full)',
+    'deferred_partial': '⏸️ Deferred (Partial)',
+    'tomorrow': '🗓️ Tomorrow'
+}
+
+
+# Select options for an unreviewed PL; the label dicts are shared and only the value varies per PL
+_PL_ACTION_OPTIONS = (
+    ("approve", {"type": "plain_text", "text": "✅ Approved"}),
+    ("defer", {"type": "plain_text", "text": "⏸️ Deferred"}),
+    ("tomorrow", {"type": "plain_text", "text": "🗓️ Tomorrow"}),
+    ("reset", {"type": "plain_text", "text": "↩️ Reset"})
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_pl_block(pl: str, status: str = None, user: str = None, deferred_epics: tuple = ()) -> dict:
+    """Render one PL's section block; memoized on the PL's review state, so callers must not mutate it."""
+    pl_action_id = clean_pl_name_for_action(pl)
+    if status:
+        status_line = _STATUS_TEXT.get(status, status)
+        if status == "deferred_partial" and deferred_epics:
+            preview = ", ".join(deferred_epics[:3])
+            if len(deferred_epics) > 3:
+                preview += "..."
+            status_line = f"⏸️ Deferred (Partial: {preview})"
+        return {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": f"*{pl}*\n{status_line} by @{user}"},
+            "accessory": {
+                "type": "button",
+                "text": {"type": "plain_text", "text": "↩️ Reset"},
+                "action_id": f"reset_{pl_action_id}"
+            }
+        }
+    return {
+        "type": "section",
+        "text": {"type": "mrkdwn", "text": f"*{pl}*"},
+        "accessory": {
+            "type": "static_select",
+            "action_id": f"actions_{pl_action_id}",
+            "placeholder": {"type": "plain_text", "text": "Choose action"},
+            "options": [
+                {"text": text, "value": f"{prefix}_{pl_action_id}"}
+                for prefix, text in _PL_ACTION_OPTIONS
+            ]
+        }
+    }
 
 
-def build_pl_blocks(pls: list, message_ts: str = None) -> list:
-    blocks = []
-    approval_states = load_approval_states()
+def build_pl_blocks(pls: list, message_ts: str = None, approval_states: dict = None) -> list:
+    if approval_states is None:
+        approval_states = load_approval_states()
+    message_states = approval_states.get(message_ts, {}) if message_ts else {}
 
+    blocks = []
     for pl in pls:
-        pl_action_id = clean_pl_name_for_action(pl)
-        reviewed_status = None
-        reviewed_by = None
-        pl_state = None
-        if message_ts and message_ts in approval_states:
-            pl_state = approval_states[message_ts].get(pl)
-            if pl_state:
-                reviewed_status = pl_state['status']
-                reviewed_by = pl_state['user']
-
-        if reviewed_status:
-            status_text = {
-                'approved': '✅ Approved',
-                'rejected': '⏸️ Deferred (Full)',
-                'deferred_full': '⏸️ Deferred (Full)',
-                'deferred_partial': '⏸️ Deferred (Partial)',
-                'tomorrow': '🗓️ Tomorrow'
-            }
-            status_line = status_text.get(reviewed_status, reviewed_status)
-            if reviewed_status == "deferred_partial":
-                deferred_epics = pl_state.get("deferred_epics", []) if pl_state else []
-                if deferred_epics:
-                    preview = ", ".join(deferred_epics[:3])
-                    if len(deferred_epics) > 3:
-                        preview += "..."
-                    status_line = f"⏸️ Deferred (Partial: {preview})"
-            blocks.append({
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": f"*{pl}*\n{status_line} by @{reviewed_by}"},
-                "accessory": {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "↩️ Reset"},
-                    "action_id": f"reset_{pl_action_id}"
-                }
-            })
+        pl_state = message_states.get(pl)
+        if pl_state and pl_state.get('status'):
+            blocks.append(_render_pl_block(pl, pl_state['status'], pl_state['user'],
+                                           tuple(pl_state.get("deferred_epics") or ())))
         else:
-            blocks.append({
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": f"*{pl}*"},
-                "accessory": {
-                    "type": "static_select",
-                    "action_id": f"actions_{pl_action_id}",
-                    "placeholder": {"type": "plain_text", "text": "Choose action"},
-                    "options": [
-                        {"text": {"type": "plain_text", "text": "✅ Approved"}, "value": f"approve_{pl_action_id}"},
-                        {"text": {"type": "plain_text", "text": "⏸️ Deferred"}, "value": f"defer_{pl_action_id}"},
-                        {"text": {"type": "plain_text", "text": "🗓️ Tomorrow"}, "value": f"tomorrow_{pl_action_id}"},
-                        {"text": {"type": "plain_text", "text": "↩️ Reset"}, "value": f"reset_{pl_action_id}"}
-                    ]
-                }
-            })
+            blocks.append(_render_pl_block(pl))
     return blocks
 
 
-def count_pending_reviews(message_ts: str) -> int:
-    message_metadata = load_message_metadata()
-    approval_states = load_approval_states()
+def count_pending_reviews(message_ts: str, message_metadata: dict = None, approval_states: dict = None) -> int:
+    if message_metadata is None:
+        message_metadata = load_message_metadata()
+    if approval_states is None:
+        approval_states = load_approval_states()
     if message_ts not in message_metadata:
         return 0
     all_pls = message_metadata[message_ts].get('pls', [])
@@ -547,13 +901,14 @@ def count_pending_reviews(message_ts: str) -> int:
     return len(all_pls) - len(reviewed)
 
 
-def all_pls_reviewed(message_ts: str) -> bool:
-    return count_pending_reviews(message_ts) == 0
+def all_pls_reviewed(message_ts: str, message_metadata: dict = None, approval_states: dict = None) -> bool:
+    return count_pending_reviews(message_ts, message_metadata, approval_states) == 0
 
 
-def build_footer_blocks(message_ts: str = None, pls: list = None, no_announce: bool = False) -> list:
+def build_footer_blocks(message_ts: str = None, pls: list = None, no_announce: bool = False,
+                        message_metadata: dict = None, approval_states: dict = None) -> list:
     blocks = []
-    pending_count = count_pending_reviews(message_ts) if message_ts else len(pls or [])
+    pending_count = count_pending_reviews(message_ts, message_metadata, approval_states) if message_ts else len(pls or [])
     all_reviewed = pending_count == 0
 
     if pending_count > 0:
@@ -577,13 +932,15 @@ def build_footer_blocks(message_ts: str = None, pls: list = None, no_announce: b
     return blocks
 
 
-def _get_announceable_pls(message_ts: str) -> list:
-    approval_states = load_approval_states()
-    message_metadata = load_message_metadata()
+def _get_announceable_pls(message_ts: str, approval_states: dict = None, message_metadata: dict = None) -> list:
+    if approval_states is None:
+        approval_states = load_approval_states()
+    if message_metadata is None:
+        message_metadata = load_message_metadata()
 
     approved_pls = []
     deferred_partial = {}
-    for pl, state in approval_states.get(message_ts, {}).items():
+    for pl, state in list(approval_states.get(message_ts, {}).items()):
         status = state.get('status')
         if status == 'approved':
             approved_pls.append(pl)
@@ -593,55 +950,48 @@ def _get_announceable_pls(message_ts: str) -> list:
 
     approved_pls = get_ordered_pls(approved_pls)
 
-    try:
-        with open('processed_notes.json', 'r') as f:
-            processed_data = json.load(f)
-    except Exception:
-        processed_data = {}
+    processed_data = load_json('processed_notes.json', {})
 
-    body_by_pl = processed_data.get('body_by_pl', {})
     notes_by_pl = message_metadata.get(message_ts, {}).get('notes_by_pl', {}) if message_metadata else {}
+    key_index = _build_processed_key_index(processed_data)
     announced_pls = []
 
     for pl in approved_pls:
-        resolved_key = _resolve_pl_key_from_processed(pl, processed_data)
-        body = body_by_pl.get(resolved_key, "") or body_by_pl.get(pl, "") or body_by_pl.get(pl.replace(' 2026', ''), "")
-        if not body and notes_by_pl:
-            notes_key = _resolve_pl_key(pl, notes_by_pl)
-            body = notes_by_pl.get(notes_key, "")
-        if pl in deferred_partial and body:
-            body = _filter_body_by_deferred_epics(body, deferred_partial.get(pl, []))
+        _, body = _resolve_announce_body(pl, processed_data, key_index, notes_by_pl, deferred_partial.get(pl))
         if body and body.strip():
             announced_pls.append(pl)
 
     return announced_pls
 
 
-def update_message_with_status(channel: str, message_ts: str, user_id: str = None):
-    message_metadata = load_message_metadata()
+# Blocks this process last sent for each review message, so unchanged re-renders skip chat_update
+_last_sent_blocks = {}
+
+
+def update_message_with_status(channel: str, message_ts: str, user_id: str = None, message_metadata: dict = None):
+    if message_metadata is None:
+        message_metadata = load_message_metadata()
     if message_ts not in message_metadata:
         return
 
+    approval_states = load_approval_states()
     pls = message_metadata[message_ts].get('pls', [])
     doc_url = message_metadata[message_ts].get('doc_url', '')
     release_date = message_metadata[message_ts].get('release_date', '')
 
-    blocks = [
-        {"type": "header", "text": {"type": "plain_text", "text": "Release Notes Review", "emoji": True}},
-        {"type": "section", "text": {"type": "mrkdwn", "text": f"Daily Consolidated Deployment Summary" + (f" - {release_date}" if release_date else "")}}
-    ]
-    if doc_url:
-        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": f"<{doc_url}|📄 View Release Notes>"}})
-
-    blocks.extend(build_refresh_blocks())
-    blocks.append({"type": "divider"})
-    blocks.extend(build_pl_blocks(pls, message_ts))
-    blocks.append({"type": "divider"})
-    no_announce = all_pls_reviewed(message_ts) and len(_get_announceable_pls(message_ts)) == 0
-    blocks.extend(build_footer_blocks(message_ts, pls, no_announce=no_announce))
+    blocks = _review_header_blocks(release_date, doc_url)
+    blocks.extend(build_pl_blocks(pls, message_ts, approval_states))
+    blocks.append(_DIVIDER_BLOCK)
+    no_announce = (all_pls_reviewed(message_ts, message_metadata, approval_states)
+                   and len(_get_announceable_pls(message_ts, approval_states, message_metadata)) == 0)
+    blocks.extend(build_footer_blocks(message_ts, pls, no_announce=no_announce,
+                                      message_metadata=message_metadata, approval_states=approval_states))
 
+    if _last_sent_blocks.get(message_ts) == blocks:
+        return
     try:
         client.chat_update(channel=channel, ts=message_ts, blocks=blocks, text="Release Notes Review")
+        _last_sent_blocks[message_ts] = blocks
     except SlackApiError as e:
         if user_id:
             try:
@@ -650,15 +1000,72 @@ def update_message_with_status(channel: str, message_ts: str, user_id: str = Non
                 pass
 
 
+# Review-message refreshes are debounced per message: rapid clicks on the same
+# message collapse into a single chat_update rendered from the latest state.
+STATUS_UPDATE_DEBOUNCE_SECONDS = 0.3
+_status_update_timers = {}
+_status_update_lock = threading.Lock()
+
+
+def schedule_status_update(channel: str, message_ts: str, user_id: str = None):
+    def _fire():
+        with _status_update_lock:
+            if _status_update_timers.get(message_ts) is timer:
+                del _status_update_timers[message_ts]
+        update_message_with_status(channel, message_ts, user_id)
+
+    timer = threading.Timer(STATUS_UPDATE_DEBOUNCE_SECONDS, _fire)
+    timer.daemon = True
+    with _status_update_lock:
+        previous = _status_update_timers.get(message_ts)
+        if previous:
+            previous.cancel()
+        _status_update_timers[message_ts] = timer
+    timer.start()
+
+
+def _cancel_status_update(message_ts: str):
+    with _status_update_lock:
+        timer = _status_update_timers.pop(message_ts, None)
+    if timer:
+        timer.cancel()
+
+
+# Google Docs edits run one at a time off the click path: remove/restore rewrite
+# the same document by index, so overlapping edits could interleave.
+_gdocs_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gdocs")
+_gdocs_handler = None
+
+
+def _get_google_docs():
+    """Return the shared authenticated GoogleDocsHandler, or None if authentication fails."""
+    global _gdocs_handler
+    if _gdocs_handler is None:
+        from google_docs_handler import GoogleDocsHandler
+        google_docs = GoogleDocsHandler()
+        if not google_docs.authenticate():
+            return None
+        _gdocs_handler = google_docs
+    return _gdocs_handler
+
+
+def remove_pl_from_google_doc(pl_name: str):
+    try:
+        google_docs = _get_google_docs()
+        if google_docs:
+            google_docs.remove_pl_section(pl_name)
+    except Exception as e:
+        logger.error("Error removing %s from Google Doc: %s", pl_name, e)
+
+
 def restore_pl_to_google_doc(pl_name: str, deferred_pl_data: dict, message_ts: str) -> bool:
     try:
-        from google_docs_handler import GoogleDocsHandler
         from google_docs_formatter import GoogleDocsFormatter, get_ordered_pls
 
         message_metadata = load_message_metadata()
         release_date = message_metadata.get(message_ts, {}).get('release_date', '')
-        google_docs = GoogleDocsHandler()
-        if not google_docs.authenticate() or not google_docs.test_connection():
+        google_docs = _get_google_docs()
+        if not google_docs or not google_docs.test_connection():
             return False
 
         full_text = google_docs.get_document_content()
@@ -693,7 +1100,7 @@ def restore_pl_to_google_doc(pl_name: str, deferred_pl_data: dict, message_ts: s
             release_start = 0
 
         section_text = full_text[release_start:]
-        separator_match = re.search(r'\n═{20,}\n', section_text)
+        separator_match = _DOC_SEPARATOR_RE.search(section_text)
         section_end = release_start + separator_match.start() if separator_match else len(full_text)
 
         tldr_summary = deferred_pl_data.get('tldr') or deferred_pl_data.get('notes') or "Updates added"
@@ -701,13 +1108,12 @@ def restore_pl_to_google_doc(pl_name: str, deferred_pl_data: dict, message_ts: s
         tldr_line = f"• {pl_clean} - {tldr_summary}\n"
 
         tldr_insert_text_pos = None
-        tldr_header_match = re.search(r'-{10,}\s*TL;DR:?\s*-{10,}', section_text, re.IGNORECASE)
+        tldr_header_match = _DOC_TLDR_HEADER_RE.search(section_text)
         if tldr_header_match:
             after_tldr_header = tldr_header_match.end()
-            rest = section_text[after_tldr_header:]
-            next_header = re.search(r'\n-{10,}[^-]+-{10,}', rest)
+            next_header = _DOC_SECTION_HEADER_RE.search(section_text, after_tldr_header)
             if next_header:
-                tldr_insert_text_pos = release_start + after_tldr_header + next_header.start()
+                tldr_insert_text_pos = release_start + next_header.start()
             else:
                 tldr_insert_text_pos = release_start + len(section_text)
 
@@ -744,13 +1150,12 @@ def restore_pl_to_google_doc(pl_name: str, deferred_pl_data: dict, message_ts: s
         category_insert_text_pos = None
         if category_start != -1:
             after_header = category_start + len(header_text)
-            rest = section_text[after_header:]
-            next_header = re.search(r'\n-{10,}[^-]+-{10,}', rest)
-            category_end = after_header + (next_header.start() if next_header else len(rest))
+            next_header = _DOC_SECTION_HEADER_RE.search(section_text, after_header)
+            category_end = next_header.start() if next_header else len(section_text)
 
             # Find existing PL headers within category section
             category_body = section_text[after_header:category_end]
-            pl_header_matches = list(re.finditer(r'(^[^\n]+:\s*Release\s+\d+(?:\.\d+)?)', category_body, re.MULTILINE))
+            pl_header_matches = list(_DOC_PL_HEADER_RE.finditer(category_body))
             existing_pls = []
             for m in pl_header_matches:
                 header_line = m.group(1)
@@ -897,51 +1302,44 @@ def restore_pl_to_google_doc(pl_name: str, deferred_pl_data: dict, message_ts: s
                 body_format_requests.append(new_req)
             jobs.append((body_insert_index, body_insert_requests, body_format_requests))
 
+        # Later anchors first so earlier inserts don't shift them; each job keeps
+        # its inserts ahead of its formats, all applied in one batchUpdate.
         jobs.sort(key=lambda x: x[0], reverse=True)
+        batch_requests = []
         for _, insert_reqs, format_reqs in jobs:
-            if insert_reqs:
-                google_docs.update_document(insert_reqs)
-            if format_reqs:
-                google_docs.update_document(format_reqs)
+            batch_requests.extend(insert_reqs)
+            batch_requests.extend(format_reqs)
+        if batch_requests:
+            google_docs.update_document(batch_requests)
 
         return True
     except Exception:
         return False
 
 
-@app.action(re.compile(r"^approve_.+$"))
-def handle_approve(ack, body, action):
-    ack()
-    def _work():
-        pl_name = get_pl_name_from_action(action['action_id'])
-        user = body['user']['username']
-        user_id = body['user']['id']
-        message_ts = body['message']['ts']
-        channel = body['channel']['id']
+# Status recorded for each direct review action prefix
+_REVIEW_STATUS_BY_PREFIX = {"approve": "approved", "reject": "deferred_full"}
+
 
+def _set_pl_status(message_ts: str, pl_name: str, status: str, user: str, now: datetime = None, **extra):
+    # load_approval_states hands back the in-memory copy (pending or cached), so this never re-reads the file
+    with _state_lock:
         approval_states = load_approval_states()
         approval_states.setdefault(message_ts, {})
-        approval_states[message_ts][pl_name] = {"status": "approved", "user": user, "timestamp": datetime.now().isoformat()}
+        approval_states[message_ts][pl_name] = {"status": status, "user": user,
+                                                "timestamp": (now or datetime.now()).isoformat(), **extra}
         save_approval_states(approval_states)
-        update_message_with_status(channel, message_ts, user_id)
-    run_async(_work)
 
 
-@app.action(re.compile(r"^reject_.+$"))
-def handle_reject(ack, body, action):
+@app.action(re.compile(r"^(?:approve|reject)_."))
+def handle_review(ack, body, action):
     ack()
+    status = _REVIEW_STATUS_BY_PREFIX[action['action_id'].split('_', 1)[0]]
     def _work():
-        pl_name = get_pl_name_from_action(action['action_id'])
-        user = body['user']['username']
-        user_id = body['user']['id']
         message_ts = body['message']['ts']
-        channel = body['channel']['id']
-
-        approval_states = load_approval_states()
-        approval_states.setdefault(message_ts, {})
-        approval_states[message_ts][pl_name] = {"status": "deferred_full", "user": user, "timestamp": datetime.now().isoformat()}
-        save_approval_states(approval_states)
-        update_message_with_status(channel, message_ts, user_id)
+        pl_name = _pl_name_for_action(action['action_id'], message_ts)
+        _set_pl_status(message_ts, pl_name, status, body['user']['username'])
+        schedule_status_update(body['channel']['id'], message_ts, body['user']['id'])
     run_async(_work)
 
 
@@ -1069,12 +1467,12 @@ def handle_defer_scope_change(ack, body, action):
         pass
 
 
-@app.action(re.compile(r"^defer_.+$"))
+@app.action(re.compile(r"^defer_."))
 def handle_defer(ack, body, action):
     ack()
     trigger_id = body.get("trigger_id")
-    pl_name = get_pl_name_from_action(action['action_id'])
     message_ts = body.get("message", {}).get("ts") or body.get("container", {}).get("message_ts")
+    pl_name = _pl_name_for_action(action['action_id'], message_ts)
     channel = body.get("channel", {}).get("id") or body.get("container", {}).get("channel_id")
     user_id = body.get("user", {}).get("id")
 
@@ -1093,11 +1491,11 @@ def handle_defer(ack, body, action):
         _open_defer_modal(trigger_id, pl_name, message_ts, channel)
     except Exception as e:
         try:
-            print(f"[Defer Modal] Error opening modal: {e}")
+            logger.error("Error opening defer modal: %s", e)
             response = getattr(e, "response", None)
             if response is not None:
                 try:
-                    print(f"[Defer Modal] Response: {response}")
+                    logger.error("Defer modal response: %s", response)
                 except Exception:
                     pass
         except Exception:
@@ -1145,57 +1543,41 @@ def handle_defer_view_submission(ack, body, view):
         user = body['user']['username']
         user_id = body['user']['id']
 
-        approval_states = load_approval_states()
-        approval_states.setdefault(message_ts, {})
         if scope_value == "partial":
-            approval_states[message_ts][pl_name] = {
-                "status": "deferred_partial",
-                "user": user,
-                "timestamp": datetime.now().isoformat(),
-                "deferred_epics": deferred_epics
-            }
+            _set_pl_status(message_ts, pl_name, "deferred_partial", user, deferred_epics=deferred_epics)
         else:
-            approval_states[message_ts][pl_name] = {
-                "status": "deferred_full",
-                "user": user,
-                "timestamp": datetime.now().isoformat()
-            }
-        save_approval_states(approval_states)
-        update_message_with_status(channel, message_ts, user_id)
+            _set_pl_status(message_ts, pl_name, "deferred_full", user)
+        schedule_status_update(channel, message_ts, user_id)
     except Exception:
         pass
 
 
-@app.action(re.compile(r"^tomorrow_.+$"))
+@app.action(re.compile(r"^tomorrow_."))
 def handle_tomorrow(ack, body, action):
     ack()
     def _work():
-        pl_name = get_pl_name_from_action(action['action_id'])
         user = body['user']['username']
         user_id = body['user']['id']
         message_ts = body['message']['ts']
+        pl_name = _pl_name_for_action(action['action_id'], message_ts)
         channel = body['channel']['id']
 
-        approval_states = load_approval_states()
-        approval_states.setdefault(message_ts, {})
-        approval_states[message_ts][pl_name] = {"status": "tomorrow", "user": user, "timestamp": datetime.now().isoformat()}
-        save_approval_states(approval_states)
-
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
-        deferred_pls = load_deferred_pls()
-        deferred_pls.setdefault(tomorrow, [])
+        now = datetime.now()
+        _set_pl_status(message_ts, pl_name, "tomorrow", user, now)
 
-        pl_notes = load_message_metadata().get(message_ts, {}).get('notes_by_pl', {}).get(pl_name, '')
-        pl_data = {'pl': pl_name, 'notes': pl_notes, 'deferred_by': user, 'deferred_at': datetime.now().isoformat()}
+        tomorrow = (now + timedelta(days=1)).strftime('%Y-%m-%d')
+        message_metadata = load_message_metadata()
+        pl_notes = message_metadata.get(message_ts, {}).get('notes_by_pl', {}).get(pl_name, '')
+        pl_data = {'pl': pl_name, 'notes': pl_notes, 'deferred_by': user, 'deferred_at': now.isoformat()}
 
         try:
-            with open('processed_notes.json', 'r') as f:
-                processed_data = json.load(f)
-            original_pl = None
-            for pl in processed_data.get('product_lines', []):
-                if pl_name in pl or pl in pl_name or pl.replace(' 2026', '').replace(' 2025', '') == pl_name:
-                    original_pl = pl
-                    break
+            processed_data = load_json('processed_notes.json', {})
+            original_pl = _product_line_name_map(processed_data).get(pl_name)
+            if original_pl is None:
+                for pl in processed_data.get('product_lines', []):
+                    if pl_name in pl or pl in pl_name:
+                        original_pl = pl
+                        break
             if original_pl:
                 pl_data['tldr'] = processed_data.get('tldr_by_pl', {}).get(original_pl, '')
                 pl_data['body'] = processed_data.get('body_by_pl', {}).get(original_pl, '')
@@ -1208,75 +1590,69 @@ def handle_tomorrow(ack, body, action):
         except Exception:
             pass
 
-        deferred_pls[tomorrow].append(pl_data)
-        save_deferred_pls(deferred_pls)
-        update_message_with_status(channel, message_ts, user_id)
-
-        def _remove_from_doc():
-            try:
-                from google_docs_handler import GoogleDocsHandler
-                google_docs = GoogleDocsHandler()
-                if google_docs.authenticate():
-                    google_docs.remove_pl_section(pl_name)
-            except Exception:
-                pass
-        run_async(_remove_from_doc)
+        with _state_lock:
+            deferred_pls = load_deferred_pls()
+            deferred_pls.setdefault(tomorrow, []).append(pl_data)
+            save_deferred_pls(deferred_pls)
+        schedule_status_update(channel, message_ts, user_id)
+        _gdocs_executor.submit(remove_pl_from_google_doc, pl_name)
     run_async(_work)
 
 
-@app.action(re.compile(r"^actions_.+$"))
+@app.action(re.compile(r"^actions_."))
 def handle_overflow_actions(ack, body, action):
     ack()
     selected_value = action.get("selected_option", {}).get("value")
     if not selected_value:
         return
     action["action_id"] = selected_value
+    prefix = selected_value.split('_', 1)[0]
     def _dispatch():
-        if selected_value.startswith("approve_"):
-            handle_approve(lambda: None, body, action)
-        elif selected_value.startswith("reject_"):
-            handle_reject(lambda: None, body, action)
-        elif selected_value.startswith("defer_"):
+        if prefix in _REVIEW_STATUS_BY_PREFIX:
+            handle_review(lambda: None, body, action)
+        elif prefix == "defer":
             handle_defer(lambda: None, body, action)
-        elif selected_value.startswith("tomorrow_"):
+        elif prefix == "tomorrow":
             handle_tomorrow(lambda: None, body, action)
-        elif selected_value.startswith("reset_"):
+        elif prefix == "reset":
             handle_reset(lambda: None, body, action)
-    threading.Thread(target=_dispatch, daemon=True).start()
+    run_async(_dispatch)
 
 
-@app.action(re.compile(r"^reset_.+$"))
+@app.action(re.compile(r"^reset_."))
 def handle_reset(ack, body, action):
     ack()
     def _work():
-        pl_name = get_pl_name_from_action(action['action_id'])
         user_id = body['user']['id']
         message_ts = body['message']['ts']
+        pl_name = _pl_name_for_action(action['action_id'], message_ts)
         channel = body['channel']['id']
 
-        approval_states = load_approval_states()
-        previous_state = approval_states.get(message_ts, {}).get(pl_name, {})
-        previous_status = previous_state.get('status')
+        with _state_lock:
+            approval_states = load_approval_states()
+            previous_state = approval_states.get(message_ts, {}).get(pl_name, {})
+            previous_status = previous_state.get('status')
 
-        if message_ts in approval_states and pl_name in approval_states[message_ts]:
-            del approval_states[message_ts][pl_name]
-            save_approval_states(approval_states)
+            if message_ts in approval_states and pl_name in approval_states[message_ts]:
+                del approval_states[message_ts][pl_name]
+                save_approval_states(approval_states)
 
         if previous_status == 'tomorrow':
             tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
-            deferred_pls = load_deferred_pls()
             deferred_pl_data = None
-            if tomorrow in deferred_pls:
-                for d in deferred_pls[tomorrow]:
-                    if d.get('pl') == pl_name:
-                        deferred_pl_data = d
-                        break
-                deferred_pls[tomorrow] = [d for d in deferred_pls[tomorrow] if d.get('pl') != pl_name]
-                save_deferred_pls(deferred_pls)
+            with _state_lock:
+                deferred_pls = load_deferred_pls()
+                if tomorrow in deferred_pls:
+                    for d in deferred_pls[tomorrow]:
+                        if d.get('pl') == pl_name:
+                            deferred_pl_data = d
+                            break
+                    deferred_pls[tomorrow] = [d for d in deferred_pls[tomorrow] if d.get('pl') != pl_name]
+                    save_deferred_pls(deferred_pls)
             if deferred_pl_data:
-                run_async(restore_pl_to_google_doc, pl_name, deferred_pl_data, message_ts)
+                _gdocs_executor.submit(restore_pl_to_google_doc, pl_name, deferred_pl_data, message_ts)
 
-        update_message_with_status(channel, message_ts, user_id)
+        schedule_status_update(channel, message_ts, user_id)
     run_async(_work)
 
 
@@ -1313,32 +1689,34 @@ def handle_refresh_versions(ack, body):
                 return
 
             # Update metadata with new PLs
-            message_metadata = load_message_metadata()
-            if message_ts in message_metadata:
-                existing_pls = message_metadata[message_ts].get('pls', [])
-                for pl in new_pls:
-                    pl_clean = re.sub(r'\s+20\d{2}$', '', pl)
-                    if pl_clean not in existing_pls:
-                        existing_pls.append(pl_clean)
-                message_metadata[message_ts]['pls'] = existing_pls
-
-                existing_notes = message_metadata[message_ts].get('notes_by_pl', {})
-                new_processed = result.get('processed_data', {})
-                existing_processed = result.get('processed_existing', {})
-
-                # Merge new PL bodies
-                existing_notes.update(new_processed.get('body_by_pl', {}))
-
-                # Append new content for existing PLs
-                for pl, body in existing_processed.get('body_by_pl', {}).items():
-                    if not body:
-                        continue
-                    if pl in existing_notes and existing_notes[pl]:
-                        existing_notes[pl] = existing_notes[pl].rstrip() + "\n" + body.lstrip()
-                    else:
-                        existing_notes[pl] = body
-                message_metadata[message_ts]['notes_by_pl'] = existing_notes
-                save_message_metadata(message_metadata)
+            with _state_lock:
+                message_metadata = load_message_metadata()
+                if message_ts in message_metadata:
+                    existing_pls = message_metadata[message_ts].get('pls', [])
+                    for pl in new_pls:
+                        pl_clean = _strip_year(pl)
+                        if pl_clean not in existing_pls:
+                            existing_pls.append(pl_clean)
+                    message_metadata[message_ts]['pls'] = existing_pls
+                    message_metadata[message_ts]['action_map'] = _build_action_map(existing_pls)
+
+                    existing_notes = message_metadata[message_ts].get('notes_by_pl', {})
+                    new_processed = result.get('processed_data', {})
+                    existing_processed = result.get('processed_existing', {})
+
+                    # Merge new PL bodies
+                    existing_notes.update(new_processed.get('body_by_pl', {}))
+
+                    # Append new content for existing PLs
+                    for pl, body in existing_processed.get('body_by_pl', {}).items():
+                        if not body:
+                            continue
+                        if pl in existing_notes and existing_notes[pl]:
+                            existing_notes[pl] = existing_notes[pl].rstrip() + "\n" + body.lstrip()
+                        else:
+                            existing_notes[pl] = body
+                    message_metadata[message_ts]['notes_by_pl'] = existing_notes
+                    save_message_metadata(message_metadata)
 
             update_message_with_status(channel, message_ts)
             try:
@@ -1358,6 +1736,16 @@ def handle_refresh_versions(ack, body):
     run_async(_work)
 
 
+# Summary bucket per review status; partial deferrals still announce their remaining epics
+_ANNOUNCE_BUCKETS = {
+    'approved': 'approved',
+    'deferred_partial': 'approved',
+    'rejected': 'deferred_full',
+    'deferred_full': 'deferred_full',
+    'tomorrow': 'tomorrow'
+}
+
+
 @app.action("good_to_announce")
 def handle_good_to_announce(ack, body):
     ack()
@@ -1366,61 +1754,47 @@ def handle_good_to_announce(ack, body):
     message_ts = body['message']['ts']
     user_id = body['user']['id']
 
-    if not all_pls_reviewed(message_ts):
-        return
-
     approval_states = load_approval_states()
     message_metadata = load_message_metadata()
+    if not all_pls_reviewed(message_ts, message_metadata, approval_states):
+        return
+    # A queued status refresh must not land on top of the announced summary
+    _cancel_status_update(message_ts)
+    _last_sent_blocks.pop(message_ts, None)
 
-    approved_pls = []
-    deferred_full_pls = []
+    buckets = defaultdict(list)
     deferred_partial = {}
-    tomorrow_pls = []
-    for pl, state in approval_states.get(message_ts, {}).items():
+    for pl, state in list(approval_states.get(message_ts, {}).items()):
         status = state.get('status')
-        if status == 'approved':
-            approved_pls.append(pl)
-        elif status in ('rejected', 'deferred_full'):
-            deferred_full_pls.append(pl)
-        elif status == 'deferred_partial':
-            approved_pls.append(pl)
+        bucket = _ANNOUNCE_BUCKETS.get(status)
+        if bucket:
+            buckets[bucket].append(pl)
+        if status == 'deferred_partial':
             deferred_partial[pl] = state.get('deferred_epics', [])
-        elif status == 'tomorrow':
-            tomorrow_pls.append(pl)
 
-    approved_pls = get_ordered_pls(approved_pls)
+    approved_pls = get_ordered_pls(buckets['approved'])
     announce_channel = os.getenv('SLACK_ANNOUNCE_CHANNEL', channel)
-    release_date = message_metadata.get(message_ts, {}).get('release_date', datetime.now().strftime('%d %B %Y'))
-
-    try:
-        with open('processed_notes.json', 'r') as f:
-            processed_data = json.load(f)
-    except Exception:
-        processed_data = {}
+    now = datetime.now()
+    release_date = message_metadata.get(message_ts, {}).get('release_date', now.strftime('%d %B %Y'))
+    processed_data = load_json('processed_notes.json', {})
 
     tldr_by_pl = processed_data.get('tldr_by_pl', {})
-    body_by_pl = processed_data.get('body_by_pl', {})
     release_versions = processed_data.get('release_versions', {})
 
     announced_pls = []
     body_for_pl = {}
     resolved_by_pl = {}
     notes_by_pl = message_metadata.get(message_ts, {}).get('notes_by_pl', {}) if message_metadata else {}
+    key_index = _build_processed_key_index(processed_data)
     for pl in approved_pls:
-        resolved_key = _resolve_pl_key_from_processed(pl, processed_data)
+        resolved_key, body = _resolve_announce_body(pl, processed_data, key_index, notes_by_pl, deferred_partial.get(pl))
         resolved_by_pl[pl] = resolved_key
-        body = body_by_pl.get(resolved_key, "") or body_by_pl.get(pl, "") or body_by_pl.get(pl.replace(' 2026', ''), "")
-        if not body and notes_by_pl:
-            notes_key = _resolve_pl_key(pl, notes_by_pl)
-            body = notes_by_pl.get(notes_key, "")
-        if pl in deferred_partial and body:
-            body = _filter_body_by_deferred_epics(body, deferred_partial.get(pl, []))
         if body and body.strip():
             announced_pls.append(pl)
             body_for_pl[pl] = body
 
     if not announced_pls:
-        update_message_with_status(channel, message_ts, user_id)
+        update_message_with_status(channel, message_ts, user_id, message_metadata=message_metadata)
         try:
             client.chat_postEphemeral(
                 channel=channel,
@@ -1431,75 +1805,77 @@ def handle_good_to_announce(ack, body):
             pass
         return
 
-    announcement_text = f"*Daily Deployment Summary: {release_date}*\n\n"
-    announcement_text += "------------------TL;DR:------------------\n\n"
-    announcement_text += "*Key Deployments:*\n"
+    parts = [
+        f"*Daily Deployment Summary: {release_date}*\n\n",
+        "------------------TL;DR:------------------\n\n",
+        "*Key Deployments:*\n"
+    ]
     for pl in announced_pls:
         resolved_key = resolved_by_pl.get(pl, pl)
-        tldr = tldr_by_pl.get(resolved_key) or tldr_by_pl.get(pl) or tldr_by_pl.get(pl.replace(' 2026', ''))
+        tldr = tldr_by_pl.get(resolved_key) or tldr_by_pl.get(pl) or tldr_by_pl.get(_strip_year(pl))
         if tldr:
-            announcement_text += f"● *{pl}* - {tldr}\n"
-    announcement_text += "\n"
+            parts.append(f"● *{pl}* - {tldr}\n")
+    parts.append("\n")
 
     for pl in announced_pls:
         resolved_key = resolved_by_pl.get(pl, pl)
-        version = release_versions.get(resolved_key, "") or release_versions.get(pl, "") or release_versions.get(pl.replace(' 2026', ''), "")
-        announcement_text += f"------------------{pl}------------------\n"
+        version = release_versions.get(resolved_key, "") or release_versions.get(pl, "") or release_versions.get(_strip_year(pl), "")
+        parts.append(f"------------------{pl}------------------\n")
         if version:
-            announcement_text += f"{pl}: {version}\n"
+            parts.append(f"{pl}: {version}\n")
         body = body_for_pl.get(pl, "")
         if body:
-            announcement_text += f"{body}\n\n"
+            parts.append(f"{body}\n\n")
+    announcement_text = "".join(parts)
 
-    try:
-        announcement_text = auto_format_text(announcement_text, processed_data)
-        # Post as plain text to match typed-message layout
-        result = client.chat_postMessage(
-            channel=announce_channel,
-            text=announcement_text[:40000]
-        )
-        announcement_ts = result.get('ts')
-        if announcement_ts:
-            save_last_announcement(announce_channel, announcement_ts, announcement_text)
-    except Exception as e:
-        error_msg = str(e)
-        try:
-            if hasattr(e, "response"):
-                error_msg = e.response.get("error", error_msg)
-        except Exception:
-            pass
-        print(f"[Socket Mode] Error posting announcement: {error_msg}")
+    final_blocks = [
+        {"type": "section", "text": {"type": "mrkdwn", "text": f"✅ *Release Announced Successfully*\n\nAnnounced by @{user} at {now.strftime('%Y-%m-%d %H:%M')}"}},
+        {"type": "section", "text": {"type": "mrkdwn", "text": f"• Approved: {', '.join(approved_pls) or 'None'}\n• Deferred (Full): {', '.join(buckets['deferred_full']) or 'None'}\n• Deferred (Partial): {', '.join(deferred_partial) or 'None'}\n• Tomorrow: {', '.join(buckets['tomorrow']) or 'None'}"}}
+    ]
+
+    # The review-message update doesn't depend on the announcement, so both Slack calls run concurrently
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        update_future = executor.submit(client.chat_update, channel=channel, ts=message_ts, blocks=final_blocks, text="Release has been announced!")
         try:
-            client.chat_postEphemeral(
-                channel=channel,
-                user=user_id,
-                text=f"⚠️ Failed to post the final announcement: {error_msg}"
+            announcement_text = auto_format_text(announcement_text, processed_data)
+            # Post as plain text to match typed-message layout
+            result = client.chat_postMessage(
+                channel=announce_channel,
+                text=announcement_text[:SLACK_TEXT_LIMIT]
             )
-        except Exception:
-            pass
-
+            announcement_ts = result.get('ts')
+            if announcement_ts:
+                save_last_announcement(announce_channel, announcement_ts, announcement_text)
+        except Exception as e:
+            error_msg = str(e)
+            try:
+                if hasattr(e, "response"):
+                    error_msg = e.response.get("error", error_msg)
+            except Exception:
+                pass
+            logger.error("Error posting announcement: %s", error_msg)
+            try:
+                client.chat_postEphemeral(
+                    channel=channel,
+                    user=user_id,
+                    text=f"⚠️ Failed to post the final announcement: {error_msg}"
+                )
+            except Exception:
+                pass
 
-    deferred_partial_pls = list(deferred_partial.keys())
-    final_blocks = [
-        {"type": "section", "text": {"type": "mrkdwn", "text": f"✅ *Release Announced Successfully*\n\nAnnounced by @{user} at {datetime.now().strftime('%Y-%m-%d %H:%M')}"}},
-        {"type": "section", "text": {"type": "mrkdwn", "text": f"• Approved: {', '.join(approved_pls) if approved_pls else 'None'}\n• Deferred (Full): {', '.join(deferred_full_pls) if deferred_full_pls else 'None'}\n• Deferred (Partial): {', '.join(deferred_partial_pls) if deferred_partial_pls else 'None'}\n• Tomorrow: {', '.join(tomorrow_pls) if tomorrow_pls else 'None'}"}}
-    ]
-    client.chat_update(channel=channel, ts=message_ts, blocks=final_blocks, text="Release has been announced!")
+        update_future.result()
 
 
 def save_last_announcement(channel: str, message_ts: str, text: str):
     """Save the last announcement details for edit/delete."""
+    processed_data = load_json('processed_notes.json', None)
     snapshot = {}
-    try:
-        with open('processed_notes.json', 'r') as f:
-            processed_data = json.load(f)
+    if isinstance(processed_data, dict):
         snapshot = {
             "fix_version_urls": processed_data.get("fix_version_urls", {}),
             "epic_urls_by_pl": processed_data.get("epic_urls_by_pl", {}),
             "epic_urls": processed_data.get("epic_urls", {})
         }
-    except Exception:
-        snapshot = {}
 
     save_json(LAST_ANNOUNCEMENT_FILE, {
         'channel': channel,
@@ -1522,7 +1898,7 @@ def handle_delete_announcement(ack, command, respond):
 
     user = command['user_name']
     text = command.get('text', '').strip()
-    print(f"[Socket Mode] {user} triggered /delete-announcement")
+    logger.info("%s triggered /delete-announcement", user)
 
     if text:
         parts = text.split()
@@ -1556,7 +1932,7 @@ def handle_edit_announcement(ack, command, respond):
 
     user = command['user_name']
     trigger_id = command['trigger_id']
-    print(f"[Socket Mode] {user} triggered /edit-announcement")
+    logger.info("%s triggered /edit-announcement", user)
 
     last = load_last_announcement()
     if not last:
@@ -1564,12 +1940,8 @@ def handle_edit_announcement(ack, command, respond):
         return
 
     def _split_text_chunks(text: str, size: int = 3000, parts: int = 3):
-        chunks = []
-        remaining = text or ""
-        for _ in range(parts):
-            chunks.append(remaining[:size])
-            remaining = remaining[size:]
-        return chunks
+        text = text or ""
+        return [text[i * size:(i + 1) * size] for i in range(parts)]
 
     try:
         part1, part2, part3 = _split_text_chunks(last.get('text', ''), 3000, 3)
@@ -1637,18 +2009,12 @@ def handle_edit_modal_submission(ack, body, view):
     message_ts = metadata.get('message_ts')
 
     if not channel or not message_ts:
-        print("[Socket Mode] Missing channel or message_ts in edit modal")
+        logger.warning("Missing channel or message_ts in edit modal")
         return
 
     last = load_last_announcement()
     processed_snapshot = last.get('processed_snapshot') if last else None
-    processed_data = processed_snapshot or {}
-    if not processed_data:
-        try:
-            with open('processed_notes.json', 'r') as f:
-                processed_data = json.load(f)
-        except Exception:
-            processed_data = {}
+    processed_data = processed_snapshot or load_json('processed_notes.json', {})
 
     formatted_text = auto_format_text(new_text, processed_data)
 
@@ -1656,7 +2022,7 @@ def handle_edit_modal_submission(ack, body, view):
         client.chat_update(
             channel=channel,
             ts=message_ts,
-            text=formatted_text[:40000]
+            text=formatted_text[:SLACK_TEXT_LIMIT]
         )
         save_last_announcement(channel, message_ts, formatted_text)
         try:
@@ -1664,7 +2030,7 @@ def handle_edit_modal_submission(ack, body, view):
         except Exception:
             pass
     except Exception as e:
-        print(f"[Socket Mode] Error updating announcement: {e}")
+        logger.error("Error updating announcement: %s", e)
 
 
 def post_approval_message(pls: list = None, doc_url: str = None, release_date: str = None, notes_by_pl: dict = None):
@@ -1673,64 +2039,70 @@ def post_approval_message(pls: list = None, doc_url: str = None, release_date: s
         return None
 
     if not pls:
-        try:
-            with open('processed_notes.json', 'r') as f:
-                data = json.load(f)
-                pls = data.get('product_lines', [])
-                if not doc_url:
-                    doc_id = os.getenv('GOOGLE_DOC_ID')
-                    if doc_id:
-                        doc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
-                if not release_date:
-                    release_date = data.get('release_summary', '').replace('Release ', '')
-                if not notes_by_pl:
-                    notes_by_pl = data.get('body_by_pl', {})
-        except Exception:
+        data = load_json('processed_notes.json', None)
+        if isinstance(data, dict):
+            pls = data.get('product_lines', [])
+            if not doc_url:
+                doc_id = os.getenv('GOOGLE_DOC_ID')
+                if doc_id:
+                    doc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
+            if not release_date:
+                release_date = data.get('release_summary', '').replace('Release ', '')
+            if not notes_by_pl:
+                # Copy: the refresh handler updates notes_by_pl in place, and data is load_json's cached dict
+                notes_by_pl = dict(data.get('body_by_pl', {}))
+        else:
             pls = []
 
-    clean_pls = [re.sub(r'\s+20\d{2}$', '', pl) for pl in pls]
+    clean_pls = [_strip_year(pl) for pl in pls]
 
     today = datetime.now().strftime('%Y-%m-%d')
     deferred_data = load_deferred_pls()
     if today in deferred_data:
-        for deferred in deferred_data[today]:
-            if deferred['pl'] not in clean_pls:
-                clean_pls.append(deferred['pl'])
-
-    blocks = [
-        {"type": "header", "text": {"type": "plain_text", "text": "Release Notes Review", "emoji": True}},
-        {"type": "section", "text": {"type": "mrkdwn", "text": f"Daily Consolidated Deployment Summary" + (f" - {release_date}" if release_date else "")}}
-    ]
-    if doc_url:
-        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": f"<{doc_url}|📄 View Release Notes>"}})
-    blocks.extend(build_refresh_blocks())
-    blocks.append({"type": "divider"})
+        seen = set(clean_pls)
+        for deferred in list(deferred_data[today]):
+            pl = deferred['pl']
+            if pl not in seen:
+                seen.add(pl)
+                clean_pls.append(pl)
+
+    blocks = _review_header_blocks(release_date, doc_url)
     blocks.extend(build_pl_blocks(clean_pls))
-    blocks.append({"type": "divider"})
+    blocks.append(_DIVIDER_BLOCK)
     blocks.extend(build_footer_blocks(pls=clean_pls))
 
     result = client.chat_postMessage(channel=channel, text=f"Release Notes Review - {release_date}", blocks=blocks)
     message_ts = result['ts']
 
-    message_metadata = load_message_metadata()
-    message_metadata[message_ts] = {
-        'pls': clean_pls,
-        'doc_url': doc_url,
-        'release_date': release_date,
-        'notes_by_pl': notes_by_pl or {},
-        'channel': channel
-    }
-    save_message_metadata(message_metadata)
+    with _state_lock:
+        message_metadata = load_message_metadata()
+        message_metadata[message_ts] = {
+            'pls': clean_pls,
+            'action_map': _build_action_map(clean_pls),
+            'doc_url': doc_url,
+            'release_date': release_date,
+            'notes_by_pl': notes_by_pl or {},
+            'channel': channel
+        }
+        save_message_metadata(message_metadata)
     return message_ts
 
 
 def main():
+    # stdout, like the print output this replaced: the launchd plist sends stdout to socket_mode.log
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [Socket Mode] %(levelname)s: %(message)s',
+                        stream=sys.stdout)
     app_token = os.getenv("SLACK_APP_TOKEN")
     if not app_token:
-        print("ERROR: SLACK_APP_TOKEN not found!")
+        logger.error("SLACK_APP_TOKEN not found!")
         return
+    install_shutdown_flush()
+    signal.signal(signal.SIGINT, _exit_on_signal)
     handler = SocketModeHandler(app, app_token)
-    handler.start()
+    try:
+        handler.start()
+    finally:
+        flush_pending_writes()
 
 
 if __name__ == "__main__":